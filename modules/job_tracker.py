@@ -5,22 +5,31 @@ Simple job tracker module for Shaco Core.
 
 Features:
 - Job dataclass (id, role, company, status, updated_at)
-- Atomic JSON persistence (safe save)
-- CRUD functions (add, list, update, remove)
+- Atomic JSON persistence (safe save, coalesced writes)
+- In-memory job store (file is read once per session)
+- Append-only change log with periodic compaction
+- CRUD functions (add, list, update, remove, bulk update)
 - Interactive CLI with flexible exit/skip words
 - Small free-text -> command translator (keyword-based)
 """
 
 from __future__ import annotations
+import atexit
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-import tempfile
 import os
+import re
+import threading
 import uuid
-import difflib
-from typing import List, Optional, Dict, Union
+from typing import List, Optional, Dict, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; the stdlib json module is used without it
+    orjson = None
 
 # ---------- Config ----------
 DEFAULT_STATUSES = [
@@ -33,16 +42,40 @@ DEFAULT_STATUSES = [
     "todo"
 ]
 
+# Short forms accepted wherever a status is typed
+STATUS_ALIASES = {
+    "int": "interviewing",
+    "interview": "interviewing",
+    "appl": "applied",
+    "rej": "rejected",
+    "acc": "accepted",
+    "off": "offer",
+    "todo": "todo",
+}
+# Every exact spelling -> status, so normalize_status needs a single lookup
+_STATUS_LOOKUP = {**STATUS_ALIASES, **{status: status for status in DEFAULT_STATUSES}}
+
 # Words that cancel the whole interactive operation
-EXIT_WORDS = {"exit", "quit", "q", "cancel", "never mind", "nah", "nope", "forget it", "stop", "nvm"}
+EXIT_WORDS = frozenset({"exit", "quit", "q", "cancel", "never mind", "nah", "nope", "forget it", "stop", "nvm"})
 # Words that mean "leave this field blank or move on"
-SKIP_WORDS = {"skip", "pass", "s", "no", "n"}
+SKIP_WORDS = frozenset({"skip", "pass", "s", "no", "n"})
 
 DATA_FILE = Path(__file__).parent.parent / "data" / "job_data.json"
+# Saves arriving within this many seconds of each other are written once
+SAVE_DELAY = 0.05
+# Fold the change log into the data file after this many logged ops
+COMPACT_EVERY = 100
+
+
+# Keys of a serialized Job, and the ones an "update" op in the change log may set
+_JOB_KEYS = frozenset({"id", "role", "company", "status", "updated_at"})
+_UPDATABLE_FIELDS = ("role", "company", "status", "updated_at")
+# Change keys update_jobs accepts per job
+_BULK_UPDATE_KEYS = frozenset({"role", "company", "status"})
 
 
 # ---------- Data model ----------
-@dataclass
+@dataclass(slots=True)
 class Job:
     id: str
     role: str
@@ -56,20 +89,32 @@ class Job:
         if not self.updated_at:
             self.touch()
 
-    def touch(self):
-        self.updated_at = datetime.now(timezone.utc).isoformat()
+    def touch(self, now_iso: Optional[str] = None):
+        """Stamp updated_at. Bulk callers can pass one precomputed timestamp for many jobs."""
+        self.updated_at = now_iso or datetime.now(timezone.utc).isoformat()
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # flat literal: asdict() would deep-copy every field
+        return {
+            "id": self.id,
+            "role": self.role,
+            "company": self.company,
+            "status": self.status,
+            "updated_at": self.updated_at,
+        }
 
     @classmethod
     def from_dict(cls, d: Dict) -> "Job":
+        if d.keys() == _JOB_KEYS:
+            # the usual case: a record this module wrote itself
+            return cls(**d)
+        # missing id / updated_at are filled in by __post_init__
         return cls(
-            id=d.get("id", str(uuid.uuid4())),
+            id=d.get("id", ""),
             role=d.get("role", ""),
             company=d.get("company", ""),
             status=d.get("status", "applied"),
-            updated_at=d.get("updated_at", datetime.now(timezone.utc).isoformat()),
+            updated_at=d.get("updated_at", ""),
         )
 
 
@@ -78,111 +123,527 @@ def _ensure_data_path(path: Path = DATA_FILE):
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def _fsync_dir(path: Path):
+    """fsync a directory so a rename inside it survives a crash."""
+    if not hasattr(os, "O_DIRECTORY"):
+        # Windows cannot open a directory for fsync; the rename is journaled there
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _serialize_jobs(jobs: List[Job]) -> bytes:
+    """Snapshot bytes for a job list, in one encoder call."""
+    return _dumps([job.to_dict() for job in jobs], indent=True)
+
+
+def _loads(data: Union[bytes, str]):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _log_path(path: Path = DATA_FILE) -> Path:
+    return path.with_suffix(".log")
+
+
 def load_jobs(path: Path = DATA_FILE) -> List[Job]:
-    if not path.exists():
-        return []
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-    return [Job.from_dict(item) for item in raw]
+    """Read the snapshot file, then replay the change log on top of it."""
+    return _read_jobs(path)[0]
+
+
+def _read_jobs(path: Path = DATA_FILE) -> Tuple[List[Job], bool]:
+    """load_jobs, plus whether the change log ended in a torn line."""
+    # a debounced save may still be waiting; read what was last saved, not what is on disk
+    writer = _writers.get(path)
+    if writer is not None:
+        writer.flush()
+    jobs = []
+    if path.exists():
+        raw = _loads(path.read_bytes())
+        jobs = [Job.from_dict(item) for item in raw]
+    return _replay_log(jobs, _log_path(path))
+
+
+def _replay_log(jobs: List[Job], log_path: Path) -> Tuple[List[Job], bool]:
+    """
+    Applies the ops in the change log to the snapshot jobs.
+    Replaying is idempotent, so a log that outlived its compaction (crash
+    between the snapshot rename and the log truncate) is harmless.
+    Returns the jobs and whether the log is torn: replay stopped at an
+    unparsable line, or the last line is missing its newline.
+    """
+    if not log_path.exists():
+        return jobs, False
+    data = log_path.read_bytes()
+    # every append ends in a newline; without one the next append would be
+    # glued onto the last op, even if that op itself parses
+    torn = bool(data) and not data.endswith(b"\n")
+    by_id = {job.id: job for job in jobs}  # dicts keep insertion order
+    # one read of raw bytes; the JSON parser decodes each line itself
+    for line in data.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = _loads(line)
+        except ValueError:
+            # torn last line from a crash mid-append; nothing valid follows
+            torn = True
+            break
+        op = entry.get("op")
+        if op == "add":
+            job = Job.from_dict(entry.get("job", {}))
+            by_id.setdefault(job.id, job)
+        elif op == "update":
+            job = by_id.get(entry.get("id"))
+            if job is not None:
+                for field, value in entry.get("fields", {}).items():
+                    if field in _UPDATABLE_FIELDS:
+                        setattr(job, field, value)
+        elif op == "remove":
+            by_id.pop(entry.get("id"), None)
+    return list(by_id.values()), torn
+
+
+class JobWriter:
+    """
+    Coalescing writer for one data file.
+    schedule() only keeps the newest payload and writes it once the file has
+    been quiet for `delay` seconds, so a burst of saves costs a single write.
+    flush() writes whatever is still pending right away.
+    append() adds a line to the change log next to the data file; a snapshot
+    write empties that log, since the snapshot already contains its ops.
+
+    fsync is only done for durable saves: a plain save is still atomic (temp
+    file + rename, never a torn file) but a crash may lose the last few
+    seconds of changes.
+
+    A failed background write keeps its payload queued and is reported on
+    the caller's thread: the next schedule() re-raises it, and the next
+    flush() retries the write (raising if it fails again).
+    """
+
+    def __init__(self, path: Path = DATA_FILE, delay: float = SAVE_DELAY):
+        self.path = path
+        self.log_path = _log_path(path)
+        self.delay = delay
+        self._pending: Optional[bytes] = None
+        self._durable = False
+        self._writing = False
+        self._timer: Optional[threading.Timer] = None
+        self._error: Optional[Exception] = None
+        self._cond = threading.Condition()
+
+    def schedule(self, payload: bytes, durable: bool = False):
+        with self._cond:
+            error, self._error = self._error, None
+            # a newer payload supersedes whatever was waiting
+            self._pending = payload
+            self._durable = self._durable or durable
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not durable:
+                self._timer = threading.Timer(self.delay, self._fire)
+                self._timer.daemon = True
+                self._timer.start()
+        if durable:
+            # durable saves must be on disk before we return; this write
+            # attempt supersedes any earlier background failure
+            self.flush()
+        elif error is not None:
+            # the new payload is queued (and will be retried); report the failure
+            raise error
+
+    def append(self, line: bytes, durable: bool = False):
+        # a pending snapshot predates this op, so it has to land first
+        self.flush()
+        _ensure_data_path(self.path)
+        with open(self.log_path, "ab") as f:
+            f.write(line)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+
+    def flush(self, durable: bool = False):
+        with self._cond:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            while self._writing:
+                self._cond.wait()
+            if self._pending is None:
+                return
+            self._durable = self._durable or durable
+            self._writing = True
+            # retried below, on this thread; a new failure raises from here
+            self._error = None
+        self._drain()
+
+    def _fire(self):
+        with self._cond:
+            if self._writing:
+                # the running write picks up the new payload when it finishes
+                return
+            self._writing = True
+        try:
+            self._drain()
+        except Exception as exc:
+            # don't blow up on the timer thread; the caller hears about it next time
+            with self._cond:
+                self._error = exc
+
+    def _drain(self):
+        try:
+            while True:
+                with self._cond:
+                    payload, self._pending = self._pending, None
+                    durable, self._durable = self._durable, False
+                    if payload is None:
+                        return
+                try:
+                    self._write(payload, durable)
+                except Exception:
+                    with self._cond:
+                        # keep the failed payload unless a newer one arrived
+                        if self._pending is None:
+                            self._pending = payload
+                        self._durable = self._durable or durable
+                    raise
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+    def _write(self, payload: bytes, durable: bool = False):
+        _ensure_data_path(self.path)
+        # one temp name per process; writes to it are serialized by this writer
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(tmp, flags, 0o644)
+        except FileExistsError:
+            # left behind by a crashed process that had our pid
+            os.unlink(tmp)
+            fd = os.open(tmp, flags, 0o644)
+        try:
+            with open(fd, "wb") as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            # atomic replace
+            os.replace(tmp, self.path)
+        except BaseException:
+            # never leave a half-written temp file next to the data
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+        if durable:
+            _fsync_dir(self.path.parent)
+        # the snapshot now holds every logged op
+        if self.log_path.exists():
+            open(self.log_path, "wb").close()
+
+
+_writers: Dict[Path, JobWriter] = {}
+
+
+def _get_writer(path: Path = DATA_FILE) -> JobWriter:
+    writer = _writers.get(path)
+    if writer is None:
+        writer = _writers[path] = JobWriter(path)
+    return writer
+
+
+def flush_jobs(durable: bool = True):
+    """Write out every save that is still waiting in a JobWriter."""
+    for writer in list(_writers.values()):
+        writer.flush(durable)
+
+
+def _shutdown():
+    for store in list(_stores.values()):
+        if store.logged_ops:
+            store.compact()
+    flush_jobs()
+
+
+atexit.register(_shutdown)
+
+
+def save_jobs(jobs: List[Job], path: Path = DATA_FILE, durable: bool = False):
+    """
+    Save the job list. Writes are coalesced by the file's JobWriter;
+    durable=True writes (and fsyncs) immediately - use it for saves the user
+    would be upset to lose.
+    """
+    payload = _serialize_jobs(jobs)
+    _get_writer(path).schedule(payload, durable)
+    # keep the in-memory cache in step when callers save a list of their own
+    store = _stores.get(path)
+    if store is not None and jobs is not store.jobs:
+        store.replace(jobs)
+
+
+# ---------- In-memory store ----------
+class _JobStore:
+    """
+    In-memory cache of the jobs for one data file.
+    The file is read once (lazily, on first access); afterwards CRUD calls work
+    on `jobs` and the `by_id` index. Each mutation only appends one line to the
+    change log; every COMPACT_EVERY ops (and at exit) the log is folded into a
+    fresh snapshot via save_jobs.
+    """
+
+    def __init__(self, path: Path = DATA_FILE):
+        self.path = path
+        self.jobs: List[Job] = []
+        self.by_id: Dict[str, int] = {}
+        self.loaded = False
+        self.logged_ops = 0
+
+    def _load(self):
+        jobs, torn = _read_jobs(self.path)
+        self.replace(jobs)
+        log = _log_path(self.path)
+        if torn:
+            # fold the good ops into the snapshot and drop the torn tail now;
+            # appending after it would glue the next op onto the partial line
+            self.compact()
+        elif log.exists() and log.stat().st_size:
+            # ops left over from an earlier session still need compacting
+            self.logged_ops = 1
+
+    def ensure_loaded(self) -> "_JobStore":
+        if not self.loaded:
+            self._load()
+        return self
+
+    def reload(self):
+        """Drop the cached jobs and read the data file again."""
+        self._load()
+
+    def replace(self, jobs: List[Job]):
+        self.jobs = list(jobs)
+        self.by_id = {job.id: i for i, job in enumerate(self.jobs)}
+        self.loaded = True
+        self.logged_ops = 0
+
+    def append(self, job: Job):
+        self.by_id[job.id] = len(self.jobs)
+        self.jobs.append(job)
+
+    def pop(self, idx: int) -> Job:
+        job = self.jobs.pop(idx)
+        del self.by_id[job.id]
+        # everything after the removed job moved down one slot
+        for i in range(idx, len(self.jobs)):
+            self.by_id[self.jobs[i].id] = i
+        return job
+
+    def log(self, *entries: Dict, durable: bool = False):
+        """Record mutations in the change log (one write for all of them), compacting when it gets long."""
+        if not entries:
+            return
+        data = b"".join(_dumps(entry) + b"\n" for entry in entries)
+        _get_writer(self.path).append(data, durable)
+        self.logged_ops += len(entries)
+        if self.logged_ops >= COMPACT_EVERY:
+            self.compact()
+
+    def compact(self):
+        # durable: the log is truncated once the snapshot is in place
+        save_jobs(self.jobs, self.path, durable=True)
+        self.logged_ops = 0
+
+
+_stores: Dict[Path, _JobStore] = {}
+
 
+def _get_store(path: Path = DATA_FILE) -> _JobStore:
+    store = _stores.get(path)
+    if store is None:
+        store = _stores[path] = _JobStore(path)
+    return store.ensure_loaded()
 
-def save_jobs(jobs: List[Job], path: Path = DATA_FILE):
-    _ensure_data_path(path)
-    tmp = path.with_suffix(".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump([j.to_dict() for j in jobs], f, ensure_ascii=False, indent=2)
-        f.flush()
-        os.fsync(f.fileno())
-    # atomic replace
-    os.replace(tmp, path)
+
+def reload(path: Path = DATA_FILE):
+    """Re-read the data file into the in-memory store (mainly for tests)."""
+    _get_store(path).reload()
+
+
+def compact(path: Path = DATA_FILE):
+    """Fold the change log into a fresh snapshot of the data file."""
+    _get_store(path).compact()
 
 
 # ---------- Utilities ----------
-def _find_job(jobs: List[Job], identifier: Union[int, str]) -> Optional[int]:
+def _find_by_id(store: _JobStore, job_id: str) -> Optional[int]:
+    return store.by_id.get(job_id)
+
+
+def _find_by_index(store: _JobStore, idx: int) -> Optional[int]:
+    if 0 <= idx < len(store.jobs):
+        return idx
+    return None
+
+
+def _find_job(store: _JobStore, identifier: Union[int, str]) -> Optional[int]:
     """
     Accepts integer (index) or job id (string).
-    Returns index in list or None.
+    A digit string (the CLI's `rm 3`) is only tried as an index when no job
+    has that id, so id lookups never pay for the isdigit check.
+    Returns index in the store or None.
     """
-    if isinstance(identifier, int) or (isinstance(identifier, str) and identifier.isdigit()):
-        idx = int(identifier)
-        if 0 <= idx < len(jobs):
-            return idx
-        return None
-    # treat identifier as id string
-    for i, job in enumerate(jobs):
-        if job.id == identifier:
-            return i
-    return None
+    if isinstance(identifier, int):
+        return _find_by_index(store, identifier)
+    idx = _find_by_id(store, identifier)
+    if idx is None and identifier.isdigit():
+        idx = _find_by_index(store, int(identifier))
+    return idx
 
 
-def normalize_status(s: str) -> str:
+@lru_cache(maxsize=None)
+def _status_matcher():
+    """
+    Returns a function mapping text to the closest DEFAULT_STATUSES entry (or None).
+    Imported on first use: only unrecognized statuses need fuzzy matching.
+    """
+    try:
+        from rapidfuzz import fuzz, process
+    except ImportError:  # optional speed-up; difflib is used without it
+        import difflib
+
+        def match(s: str) -> Optional[str]:
+            close = difflib.get_close_matches(s, DEFAULT_STATUSES, n=1, cutoff=0.6)
+            return close[0] if close else None
+        return match
+
+    def match(s: str) -> Optional[str]:
+        found = process.extractOne(s, DEFAULT_STATUSES, scorer=fuzz.ratio, score_cutoff=60)
+        return found[0] if found else None
+    return match
+
+
+def _resolve_status(s: str) -> Optional[str]:
+    """Like normalize_status, but returns None instead of guessing "applied"."""
     s = (s or "").strip().lower()
-    mapping = {
-        "int": "interviewing",
-        "interview": "interviewing",
-        "appl": "applied",
-        "rej": "rejected",
-        "acc": "accepted",
-        "off": "offer",
-        "todo": "todo",
-    }
-    if s in DEFAULT_STATUSES:
-        return s
-    if s in mapping:
-        return mapping[s]
+    known = _STATUS_LOOKUP.get(s)
+    if known:
+        return known
     # fuzzy match
-    close = difflib.get_close_matches(s, DEFAULT_STATUSES, n=1, cutoff=0.6)
-    if close:
-        return close[0]
+    return _status_matcher()(s)
+
+
+def normalize_status(s: str) -> str:
     # fallback
-    return "applied"
+    return _resolve_status(s) or "applied"
 
 
 # ---------- CRUD API ----------
-def add_job(role: str, company: str, status: str = "applied", path: Path = DATA_FILE) -> Job:
-    jobs = load_jobs(path)
-    job = Job(id=str(uuid.uuid4()), role=role.strip(), company=company.strip(), status=normalize_status(status))
-    job.touch()
-    jobs.append(job)
-    save_jobs(jobs, path)
-    return job
+# The public functions hand out copies: editing a returned Job must not
+# change the store behind the change log's back.
+def _copy_job(job: Job) -> Job:
+    return Job(**job.to_dict())
+
+
+def add_job(role: str, company: str, status: str = "applied", path: Path = DATA_FILE,
+            durable: bool = False) -> Job:
+    store = _get_store(path)
+    # __post_init__ assigns the id and stamps updated_at
+    job = Job(id="", role=role.strip(), company=company.strip(), status=normalize_status(status))
+    store.append(job)
+    store.log({"op": "add", "job": job.to_dict()}, durable=durable)
+    return _copy_job(job)
 
 
 def list_jobs(path: Path = DATA_FILE, *, status: Optional[str] = None) -> List[Job]:
-    jobs = load_jobs(path)
+    jobs = _get_store(path).jobs
     if status:
         status = normalize_status(status)
         jobs = [j for j in jobs if j.status == status]
-    return jobs
+    return [_copy_job(j) for j in jobs]
 
 
-def remove_job(identifier: Union[int, str], path: Path = DATA_FILE) -> Optional[Job]:
-    jobs = load_jobs(path)
-    idx = _find_job(jobs, identifier)
+def remove_job(identifier: Union[int, str], path: Path = DATA_FILE,
+               durable: bool = False) -> Optional[Job]:
+    store = _get_store(path)
+    idx = _find_job(store, identifier)
     if idx is None:
         return None
-    removed = jobs.pop(idx)
-    save_jobs(jobs, path)
+    removed = store.pop(idx)
+    store.log({"op": "remove", "id": removed.id}, durable=durable)
     return removed
 
 
 def update_job(identifier: Union[int, str], *, role: Optional[str] = None,
                company: Optional[str] = None, status: Optional[str] = None,
-               path: Path = DATA_FILE) -> Optional[Job]:
-    jobs = load_jobs(path)
-    idx = _find_job(jobs, identifier)
+               path: Path = DATA_FILE, durable: bool = False) -> Optional[Job]:
+    store = _get_store(path)
+    idx = _find_job(store, identifier)
     if idx is None:
         return None
-    job = jobs[idx]
+    entry = _apply_update(store, idx, role=role, company=company, status=status)
+    store.log(entry, durable=durable)
+    return _copy_job(store.jobs[idx])
+
+
+def update_jobs(updates: List[Tuple[Union[int, str], Dict]], path: Path = DATA_FILE,
+                durable: bool = False) -> List[Optional[Job]]:
+    """
+    Bulk update_job: `updates` is a list of (identifier, {"role"/"company"/"status": value}).
+    All jobs share one timestamp and the changes go to the log in a single write.
+    Returns the updated jobs, with None where an identifier matched nothing.
+    """
+    # validate everything first so a bad entry can't leave earlier jobs changed but unlogged
+    for _, changes in updates:
+        unknown = set(changes) - _BULK_UPDATE_KEYS
+        if unknown:
+            raise TypeError(f"update_jobs got unexpected field(s): {', '.join(sorted(unknown))}")
+    store = _get_store(path)
+    now_iso = datetime.now(timezone.utc).isoformat()
+    results: List[Optional[Job]] = []
+    entries = []
+    for identifier, changes in updates:
+        idx = _find_job(store, identifier)
+        if idx is None:
+            results.append(None)
+            continue
+        entries.append(_apply_update(store, idx, now_iso=now_iso, **changes))
+        results.append(_copy_job(store.jobs[idx]))
+    store.log(*entries, durable=durable)
+    return results
+
+
+def _apply_update(store: _JobStore, idx: int, *, role: Optional[str] = None,
+                  company: Optional[str] = None, status: Optional[str] = None,
+                  now_iso: Optional[str] = None) -> Dict:
+    """Edits the job at idx in place and returns the change-log entry for it."""
+    job = store.jobs[idx]
+    fields = {}
     if role is not None:
-        job.role = role.strip()
+        job.role = fields["role"] = role.strip()
     if company is not None:
-        job.company = company.strip()
+        job.company = fields["company"] = company.strip()
     if status is not None:
-        job.status = normalize_status(status)
-    job.touch()
-    save_jobs(jobs, path)
-    return job
+        job.status = fields["status"] = normalize_status(status)
+    job.touch(now_iso)
+    fields["updated_at"] = job.updated_at
+    return {"op": "update", "id": job.id, "fields": fields}
 
 
 # ---------- Interactive helpers ----------
@@ -226,7 +687,7 @@ def add_job_interactive(path: Path = DATA_FILE):
     except AbortInteractive:
         print("Add cancelled.")
         return None
-    job = add_job(role=role, company=company, status=status or "applied", path=path)
+    job = add_job(role=role, company=company, status=status or "applied", path=path, durable=True)
     print(f"Added: {job.role} @ {job.company} (id={job.id})")
     return job
 
@@ -242,6 +703,14 @@ def _print_jobs(jobs: List[Job]):
 
 
 # ---------- Natural-language-ish translator (small, keyword-based) ----------
+# One compiled alternation per intent, built once at import
+_ADD_RE = re.compile(r"\b(?:add|create|apply|applied)\b")
+_LIST_RE = re.compile(r"\b(?:list|show|ls)\b")
+_RM_RE = re.compile(r"\b(?:remove|delete|forget)\b")
+_UPD_RE = re.compile(r"\b(?:update|change)\b")
+_EXIT_RE = re.compile(r"\b(?:exit|quit|bye)\b")
+
+
 def translate_free_text_to_cmd(text: str) -> Optional[Dict]:
     """
     Very small translator that attempts to map free text to a command.
@@ -249,7 +718,7 @@ def translate_free_text_to_cmd(text: str) -> Optional[Dict]:
     This is intentionally simple: keyword presence + a tiny regex-like parse.
     """
     t = text.lower()
-    if any(k in t for k in ("add", "create", "apply", "applied for", "i applied")):
+    if _ADD_RE.search(t):
         # naive extraction: look for "role at company" or "role @ company"
         parts = t.replace("@", " at ").split(" at ")
         if len(parts) >= 2:
@@ -257,23 +726,133 @@ def translate_free_text_to_cmd(text: str) -> Optional[Dict]:
             company = parts[1].strip()
             return {"cmd": "add", "role": role or "UNKNOWN ROLE", "company": company or "UNKNOWN COMPANY"}
         return {"cmd": "add"}
-    if any(k in t for k in ("list", "show", "ls")):
+    if _LIST_RE.search(t):
         return {"cmd": "list"}
-    if any(k in t for k in ("remove", "delete", "forget")):
+    if _RM_RE.search(t):
         # try to find an id-looking token
         tokens = t.split()
         for tok in tokens:
             if len(tok) >= 8 and "-" in tok:  # heuristic for uuid-ish
                 return {"cmd": "remove", "id": tok}
         return {"cmd": "remove"}
-    if any(k in t for k in ("update", "change")):
+    if _UPD_RE.search(t):
         return {"cmd": "update"}
-    if any(k in t for k in ("exit", "quit", "bye")):
+    if _EXIT_RE.search(t):
         return {"cmd": "exit"}
     return None
 
 
 # ---------- High-level CLI / command dispatcher ----------
+def _cmd_add(argv: List[str]):
+    if len(argv) >= 3:
+        # non-interactive add: job add "role" "company" [status]
+        role = argv[1]
+        company = argv[2]
+        status = argv[3] if len(argv) > 3 else "applied"
+        job = add_job(role, company, status)
+        print(f"Added: {job.id}")
+    else:
+        add_job_interactive()
+
+
+def _cmd_list(argv: List[str]):
+    status = argv[1] if len(argv) > 1 else None
+    jobs = list_jobs(status=status)
+    _print_jobs(jobs)
+
+
+def _cmd_remove(argv: List[str]):
+    if len(argv) < 2:
+        print("Usage: job remove <id|index>")
+        return
+    removed = remove_job(argv[1])
+    if removed:
+        print(f"Removed {removed.id}")
+    else:
+        print("No job found with that id/index.")
+
+
+def _cmd_update(argv: List[str]):
+    if len(argv) < 2:
+        print("Usage: job update <id|index> [--role newrole] [--company newcompany] [--status newstatus]")
+        return
+    # naive parsing for brevity
+    identifier = argv[1]
+    kwargs = {}
+    it = iter(argv[2:])
+    for token in it:
+        if token in ("--role", "-r"):
+            kwargs["role"] = next(it, "")
+        elif token in ("--company", "-c"):
+            kwargs["company"] = next(it, "")
+        elif token in ("--status", "-s"):
+            kwargs["status"] = next(it, "")
+    updated = update_job(identifier, **kwargs)
+    if updated:
+        print(f"Updated {updated.id}")
+    else:
+        print("No job found to update.")
+
+
+def _cmd_bulk_update(argv: List[str]):
+    current = new = None
+    it = iter(argv[1:])
+    for token in it:
+        if token in ("--status", "-s"):
+            current = next(it, "")
+        elif token in ("--to", "-t"):
+            new = next(it, "")
+    # resolve strictly: a typo must not fall back to "applied" and hit the wrong jobs
+    current = _resolve_status(current)
+    new = _resolve_status(new)
+    if not current or not new:
+        print("Usage: job bulk-update --status <current status> --to <new status>")
+        print(f"Statuses: {', '.join(DEFAULT_STATUSES)}")
+        return
+    jobs = list_jobs(status=current)
+    update_jobs([(job.id, {"status": new}) for job in jobs])
+    print(f"Updated {len(jobs)} job(s).")
+
+
+def _cmd_help(argv: List[str]):
+    print_help()
+
+
+def _try_freetext(argv: List[str]):
+    # try free-text translator
+    tl = translate_free_text_to_cmd(" ".join(argv))
+    if tl:
+        if tl["cmd"] == "add":
+            role = tl.get("role")
+            company = tl.get("company")
+            if role and company:
+                job = add_job(role, company, tl.get("status", "applied"))
+                print(f"Added {job.id}")
+                return
+        if tl["cmd"] == "list":
+            _print_jobs(list_jobs())
+            return
+    print("Unknown command. Try 'job help'.")
+
+
+# Command word (and its aliases) -> handler taking the full argv
+_CMDS = {
+    "add": _cmd_add,
+    "a": _cmd_add,
+    "list": _cmd_list,
+    "ls": _cmd_list,
+    "remove": _cmd_remove,
+    "rm": _cmd_remove,
+    "delete": _cmd_remove,
+    "update": _cmd_update,
+    "up": _cmd_update,
+    "bulk-update": _cmd_bulk_update,
+    "help": _cmd_help,
+    "-h": _cmd_help,
+    "--help": _cmd_help,
+}
+
+
 def handle_command(argv: List[str]):
     """
     Programmatic entrypoint for main.py.
@@ -282,72 +861,14 @@ def handle_command(argv: List[str]):
       handle_command(["list"]) -> show list
       handle_command(["remove", "<id-or-index>"])
       handle_command([]) -> open interactive shell
+    Unknown command words fall through to the free-text translator.
     """
     if not argv:
         interactive_mode()
         return
 
-    cmd = argv[0].lower()
-    if cmd in ("add", "a"):
-        if len(argv) >= 3:
-            # non-interactive add: job add "role" "company" [status]
-            role = argv[1]
-            company = argv[2]
-            status = argv[3] if len(argv) > 3 else "applied"
-            job = add_job(role, company, status)
-            print(f"Added: {job.id}")
-        else:
-            add_job_interactive()
-    elif cmd in ("list", "ls"):
-        status = argv[1] if len(argv) > 1 else None
-        jobs = list_jobs(status=status)
-        _print_jobs(jobs)
-    elif cmd in ("remove", "rm", "delete"):
-        if len(argv) < 2:
-            print("Usage: job remove <id|index>")
-            return
-        removed = remove_job(argv[1])
-        if removed:
-            print(f"Removed {removed.id}")
-        else:
-            print("No job found with that id/index.")
-    elif cmd in ("update", "up"):
-        if len(argv) < 2:
-            print("Usage: job update <id|index> [--role newrole] [--company newcompany] [--status newstatus]")
-            return
-        # naive parsing for brevity
-        identifier = argv[1]
-        kwargs = {}
-        it = iter(argv[2:])
-        for token in it:
-            if token in ("--role", "-r"):
-                kwargs["role"] = next(it, "")
-            elif token in ("--company", "-c"):
-                kwargs["company"] = next(it, "")
-            elif token in ("--status", "-s"):
-                kwargs["status"] = next(it, "")
-        updated = update_job(identifier, **kwargs)
-        if updated:
-            print(f"Updated {updated.id}")
-        else:
-            print("No job found to update.")
-    elif cmd in ("help", "-h", "--help"):
-        print_help()
-    else:
-        # try free-text translator
-        tl = translate_free_text_to_cmd(" ".join(argv))
-        if tl:
-            if tl["cmd"] == "add":
-                role = tl.get("role")
-                company = tl.get("company")
-                if role and company:
-                    job = add_job(role, company, tl.get("status", "applied"))
-                    print(f"Added {job.id}")
-                    return
-            if tl["cmd"] == "list":
-                _print_jobs(list_jobs())
-                return
-        print("Unknown command. Try 'job help'.")
+    handler = _CMDS.get(argv[0].lower(), _try_freetext)
+    handler(argv)
 
 
 def print_help():
@@ -357,11 +878,20 @@ def print_help():
   job list [status]      -> list jobs (optionally filter by status)
   job remove <id|index>  -> remove a job
   job update <id|index> [--role r] [--company c] [--status s] -> update
+  job bulk-update --status <s> --to <new>  -> change the status of every job with status s
   (when interacting: type 'cancel' or 'exit' to abort an operation)
 """)
 
 
-def interactive_mode():
+def interactive_mode(command: Optional[str] = None):
+    """
+    Job tracker shell.
+    With `command` (e.g. "list" from main.py's "job list") it runs just that
+    one command and returns instead of opening the prompt.
+    """
+    if command:
+        handle_command(command.split())
+        return
     print("Shaco Core — Job tracker interactive shell. Type 'help' for commands.")
     while True:
         try:
@@ -377,3 +907,5 @@ def interactive_mode():
         tokens = raw.split()
         # dispatch to handle_command for convenience
         handle_command(tokens)
+    # make sure pending saves hit the disk before handing control back
+    flush_jobs()
@@ -14,16 +14,21 @@ def divide(a, b):
         return "Cannot divide by zero"
     return a / b
 
+# Map each operation name (and its symbol) to its function
+_OPS = {
+    "add": add,
+    "subtract": subtract,
+    "multiply": multiply,
+    "divide": divide,
+    "+": add,
+    "-": subtract,
+    "*": multiply,
+    "/": divide,
+}
+
 # Define functions for each operation
 def calculate(operation, a, b):
-    if operation == "add":
-        return add(a, b)
-    elif operation == "subtract":
-        return subtract(a, b)
-    elif operation == "multiply":
-        return multiply(a, b)
-    elif operation == "divide":
-        return divide(a, b)
-    else:
+    func = _OPS.get(operation)
+    if func is None:
         return "Invalid operation"
-
+    return func(a, b)
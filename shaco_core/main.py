@@ -1,6 +1,7 @@
  # shaco_core/main.py
 import sys
 import os
+import re
 
 # Add project root so imports work
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -9,47 +10,61 @@ from modules import job_tracker
 from modules import math_helper
 from modules import reminder_bot
 
-def handle_command(command):
-    """Decide which module to call based on user input."""
-    
-    #call the math helper
-    if command.startswith("math"):
-        # Example: "math add 5 3"
-        _, operation, a, b = command.split()
-        a, b = float(a), float(b)
-        result = math_helper.calculate(operation, a, b)
-        print(f"Result: {result}")
-
-    #call the remind helper
-    elif command.startswith("remind"):
-        # Example: "remind buy milk 5"
-        parts = command.split()
-        reminder_text = " ".join(parts[1:-1])  # everything except the last word
-        time_seconds = int(parts[-1])          # last word = seconds
-        reminder_bot.add_reminder(reminder_text, time_seconds)
-    
-    elif command.startswith("job"):
-        # Remove the 'job ' prefix
-        job_command = command[len("job "):].strip()
-
-        # Quick-add format: job add "role" "company" [status]
-        if job_command.startswith("add "):
-            # Split by quotes
-            import re
-            match = re.match(r'add\s+"([^"]+)"\s+"([^"]+)"(?:\s+(\w+))?', job_command)
-            if match:
-                role, company, status = match.groups()
-                status = status or "todo"
-                job_tracker.add_job(role, company, status)
-                print(f'Added: {role} @ {company} (status={status})')
-            else:
-                print("Invalid quick-add format. Use: job add \"role\" \"company\" [status]")
+# Quick-add format: job add "role" "company" [status]
+_JOB_ADD_RE = re.compile(r'add\s+"([^"]+)"\s+"([^"]+)"(?:\s+(\w+))?')
+
+#call the math helper
+def _handle_math(rest):
+    # Example: "math add 5 3"
+    operation, a, b = rest.split()
+    a, b = float(a), float(b)
+    result = math_helper.calculate(operation, a, b)
+    print(f"Result: {result}")
+
+
+#call the remind helper
+def _handle_remind(rest):
+    # Example: "remind buy milk 5"
+    parts = rest.split()
+    reminder_text = " ".join(parts[:-1])  # everything except the last word
+    time_seconds = int(parts[-1])         # last word = seconds
+    reminder_bot.add_reminder(reminder_text, time_seconds)
+
+
+#call the job tracker
+def _handle_job(rest):
+    job_command = rest.strip()
+
+    # Quick-add format: job add "role" "company" [status]
+    if job_command.startswith("add "):
+        # Split by quotes
+        match = _JOB_ADD_RE.match(job_command)
+        if match:
+            role, company, status = match.groups()
+            status = status or "todo"
+            job_tracker.add_job(role, company, status)
+            print(f'Added: {role} @ {company} (status={status})')
         else:
-            # Enter interactive mode for other commands
-            job_tracker.interactive_mode()
+            print("Invalid quick-add format. Use: job add \"role\" \"company\" [status]")
+    else:
+        # Run a single job command, or open the job shell for a bare "job"
+        job_tracker.interactive_mode(job_command or None)
 
 
+# First word of the command -> handler for the rest of it
+_DISPATCH = {
+    "math": _handle_math,
+    "remind": _handle_remind,
+    "job": _handle_job,
+}
 
+
+def handle_command(command):
+    """Decide which module to call based on user input."""
+    cmd, _, rest = command.partition(" ")
+    handler = _DISPATCH.get(cmd)
+    if handler:
+        handler(rest)
     #if nothing else
     else:
         print("Sorry, I don’t understand that command.")
@@ -0,0 +1,82 @@
+import functools
+import os
+import sys
+
+# Add project root so imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import job_tracker
+
+
+def test_save_then_load_returns_saved_jobs(tmp_path):
+    path = tmp_path / "jobs.json"
+    # the debounced write must not hide the save from an immediate load
+    job_tracker.save_jobs([job_tracker.Job("", "dev", "acme")], path)
+    assert [j.role for j in job_tracker.load_jobs(path)] == ["dev"]
+
+
+def test_torn_log_tail_does_not_swallow_later_ops(tmp_path):
+    path = tmp_path / "jobs.json"
+    log = path.with_suffix(".log")
+    job_tracker.add_job("first", "acme", path=path)
+    # a crash mid-append leaves a partial line without its newline
+    with open(log, "ab") as f:
+        f.write(b'{"op":"add","jo')
+
+    # next session: loading must not let the next op be glued onto the torn line
+    job_tracker.reload(path)
+    job_tracker.add_job("second", "beta", path=path)
+
+    job_tracker.reload(path)
+    assert [j.role for j in job_tracker.list_jobs(path)] == ["first", "second"]
+
+
+def test_complete_last_op_without_newline_does_not_swallow_later_ops(tmp_path):
+    path = tmp_path / "jobs.json"
+    log = path.with_suffix(".log")
+    job_tracker.add_job("first", "acme", path=path)
+    second = job_tracker.add_job("second", "acme", path=path)
+    # a crash after a whole op reached the disk but before its newline did
+    with open(log, "ab") as f:
+        f.write(b'{"op":"remove","id":"%s"}' % second.id.encode())
+
+    job_tracker.reload(path)
+    job_tracker.add_job("third", "beta", path=path)
+
+    job_tracker.reload(path)
+    assert [j.role for j in job_tracker.list_jobs(path)] == ["first", "third"]
+
+
+def test_returned_jobs_are_copies(tmp_path):
+    path = tmp_path / "jobs.json"
+    added = job_tracker.add_job("dev", "acme", path=path)
+    added.role = "edited"
+    job_tracker.list_jobs(path)[0].status = "offer"
+
+    job = job_tracker.list_jobs(path)[0]
+    assert (job.role, job.status) == ("dev", "applied")
+
+
+def test_bulk_update_with_unknown_status_changes_nothing(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "jobs.json"
+    job_tracker.add_job("dev", "acme", path=path)
+    job_tracker.add_job("ops", "beta", status="rejected", path=path)
+    # the CLI works on the default data file, point it at the temp one
+    monkeypatch.setattr(job_tracker, "list_jobs", functools.partial(job_tracker.list_jobs, path))
+    monkeypatch.setattr(job_tracker, "update_jobs", functools.partial(job_tracker.update_jobs, path=path))
+
+    job_tracker.handle_command(["bulk-update", "--status", "rejcted-typo-xyz", "--to", "withdrawn"])
+    job_tracker.handle_command(["bulk-update", "--status", "rejected", "--to", "qqqqzzzz"])
+
+    assert capsys.readouterr().out.count("Usage") == 2
+    assert [j.status for j in job_tracker.list_jobs()] == ["applied", "rejected"]
+
+
+def test_translator_matches_whole_keywords_only():
+    translate = job_tracker.translate_free_text_to_cmd
+    assert translate("my address") is None
+    assert translate("lsd") is None
+    assert translate("i applied for developer at acme") == {
+        "cmd": "add", "role": "i applied for developer", "company": "acme"}
+    assert translate("show my jobs") == {"cmd": "list"}
+    assert translate("delete abcd-1234-ef") == {"cmd": "remove", "id": "abcd-1234-ef"}
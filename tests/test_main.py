@@ -0,0 +1,18 @@
+import os
+import sys
+
+# Add project root so imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shaco_core import main
+
+
+def test_command_word_must_match_exactly(capsys):
+    # "mathematician" starts with "math" but is not the math command
+    main.handle_command("mathematician")
+    assert capsys.readouterr().out == "Sorry, I don’t understand that command.\n"
+
+
+def test_math_command_dispatches(capsys):
+    main.handle_command("math add 5 3")
+    assert capsys.readouterr().out == "Result: 8.0\n"
@@ -1 +1,23 @@
- 
+import os
+import sys
+
+# Add project root so imports work
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules import math_helper
+
+
+def test_symbols_match_named_operations():
+    assert math_helper.calculate("+", 5, 3) == math_helper.calculate("add", 5, 3) == 8
+    assert math_helper.calculate("-", 5, 3) == math_helper.calculate("subtract", 5, 3) == 2
+    assert math_helper.calculate("*", 5, 3) == math_helper.calculate("multiply", 5, 3) == 15
+    assert math_helper.calculate("/", 6, 3) == math_helper.calculate("divide", 6, 3) == 2
+
+
+def test_unknown_operation():
+    assert math_helper.calculate("pow", 2, 3) == "Invalid operation"
+
+
+def test_divide_by_zero():
+    assert math_helper.calculate("divide", 1, 0) == "Cannot divide by zero"
+    assert math_helper.calculate("/", 1, 0) == "Cannot divide by zero"